@@ -21,6 +21,15 @@ except:
 
 from calculator import *
 
+# CalcMode option menu values (invariant)
+_MODE_VALUES = tuple(e.value for e in CalcMode)
+
+# menu widget colors (invariant)
+_FG_GRAY = (LIGHT_GRAY, DARK_GRAY)
+_TXT_BW = (BLACK, WHITE)
+_ORANGE_FG = COLORS['orange']['fg']
+_ORANGE_HOVER = COLORS['orange']['hover']
+
 
 class App(ctk.CTk):
     """ Main / core application class. """
@@ -40,6 +49,14 @@ class App(ctk.CTk):
         # get user settings data; if not defined, create w/ defaults
         self.loadUserSettings()
 
+        # get window handle for title bar coloring (windows only); doesn't change after window creation
+        self._hwnd = None
+        self._lastTitleBarColor = None
+        try:
+            self._hwnd = windll.user32.GetParent(self.winfo_id())
+        except:
+            pass
+
         # set light/dark appearance
         ctk.set_appearance_mode(self.userSettings['appearance'])
         isDarkMode = True if self.userSettings['appearance'] == 'dark' else False
@@ -65,9 +82,16 @@ class App(ctk.CTk):
         # create calculator instance
         self.calculator = Calculator(self)
 
-        # setup keyboard event binding
-        keyEventSequence = '<KeyPress>'
-        self.bind(keyEventSequence, self.keyEventHandle)
+        # precompute keysym -> calculator handler (w/ any arg pre-bound) lookup
+        self._keyDispatch = {}
+        for keysym, spec in KEY_FUNCTION_MAP.items():
+            function = getattr(self.calculator, spec['function'])
+            self._keyDispatch[keysym] = partial(function, spec['arg']) if 'arg' in spec else function
+
+        # setup keyboard event bindings; only mapped keys are bound, so Tk filters out all others (modifiers, arrows, etc.)
+        for keysym in self._keyDispatch:
+            keyEventSequence = f'<KeyPress-{keysym}>'
+            self.bind(keyEventSequence, self.keyEventHandle)
 
         # run
         self.mainloop()
@@ -75,23 +99,21 @@ class App(ctk.CTk):
     def keyEventHandle(self, event):
         """ Calls appropriate function based on input keyboard event. """
 
-        lookupKey = event.keysym
-        try:
-            if 'arg' in KEY_FUNCTION_MAP[lookupKey]:
-                getattr(self.calculator, KEY_FUNCTION_MAP[lookupKey]['function'])(KEY_FUNCTION_MAP[lookupKey]['arg'])
-                
-            else: # no args passed
-                getattr(self.calculator, KEY_FUNCTION_MAP[lookupKey]['function'])()
-        except:
-            pass
+        handler = self._keyDispatch.get(event.keysym)
+        if handler is not None: # ignore unmapped keys (modifiers, arrows, etc.)
+            handler()
 
     def changeTitleBarColor(self, isDark):
         """ If on Windows platform, changes app's title bar color to match rest of window. """
+
+        TITLE_BAR_COLOR = TITLE_BAR_HEX_COLORS['dark'] if isDark else TITLE_BAR_HEX_COLORS['light'] # define color
+        if self._hwnd is None or TITLE_BAR_COLOR == self._lastTitleBarColor: # not windows, or already set
+            return
+
         try: # windows only
-            HWND = windll.user32.GetParent(self.winfo_id()) # get current window
             DWMA_ATTRIBUTE = 35 # target color attribute of window's title bar
-            TITLE_BAR_COLOR = TITLE_BAR_HEX_COLORS['dark'] if isDark else TITLE_BAR_HEX_COLORS['light'] # define color
-            windll.dwmapi.DwmSetWindowAttribute(HWND, DWMA_ATTRIBUTE, byref(c_int(TITLE_BAR_COLOR)), sizeof(c_int)) # set attribute
+            windll.dwmapi.DwmSetWindowAttribute(self._hwnd, DWMA_ATTRIBUTE, byref(c_int(TITLE_BAR_COLOR)), sizeof(c_int)) # set attribute
+            self._lastTitleBarColor = TITLE_BAR_COLOR
         except:
             pass
 
@@ -125,24 +147,29 @@ class App(ctk.CTk):
     def modeOptionMenuCallback(self, selection):
         """ 
         Sets CalcApp's currentMode variable to be equivalent to the selected string menu option, if != current.
-        Destroy current activeFrame, inits a new one + all common/standard widgets, then any mode-specific widgets.
+        Hides current activeFrame, then shows the new mode's cached activeFrame;
+        if none yet, inits a new one + all common/standard widgets, then any mode-specific widgets.
         """
 
         calculator: Calculator = self.calculator
         if calculator.currentMode != CalcMode(selection):
             calculator.currentMode = CalcMode(selection)
 
-            calculator.activeFrame.destroy()
-            calculator.initCommonStandardWidgets()
+            calculator.activeFrame.pack_forget()
+
+            modeFrame = calculator.modeFrames.get(calculator.currentMode)
+            if modeFrame is not None: # mode already built; just show it again
+                calculator.activeFrame = modeFrame
+                calculator.packActiveFrame()
+                return
 
-            if calculator.currentMode != CalcMode.CM_STANDARD:
+            calculator.initCommonStandardWidgets()
 
-                match calculator.currentMode:
-                    case CalcMode.CM_PROGRAMMING:
-                        calculator.initProgrammingWidgets()
+            modeInitFunction = calculator.modeInitDispatch.get(calculator.currentMode)
+            if modeInitFunction is not None: # CM_STANDARD has no mode-specific widgets
+                modeInitFunction()
 
-                    case CalcMode.CM_SCIENTIFIC:
-                        calculator.initScientificWidgets()
+            calculator.modeFrames[calculator.currentMode] = calculator.activeFrame
     
     def initSettingsMenu(self):
         """ Initializes settings menu overlay widgets. """
@@ -153,8 +180,8 @@ class App(ctk.CTk):
         self.exitToAppButton.place(x = 0, y = 0)
 
         # setup widget fonts
-        self.smallerWidgetFont = ctk.CTkFont(family = FONT, size = 14)
-        self.largerWidgetFont = ctk.CTkFont(family = FONT, size = 16)
+        self.smallerWidgetFont = getFont(14)
+        self.largerWidgetFont = getFont(16)
 
         # container for actual settings menu overlay
         self.settingsMenuSubFrame = ctk.CTkFrame(self, width = 300, height = 285, border_color = (BLACK, WHITE), border_width = 2)
@@ -214,40 +241,79 @@ class App(ctk.CTk):
     def loadUserSettings(self):
         """ Loads user settings data from external JSON file, creating w/ defaults if necessary. Updates local data accordingly. """
         
-        defaultSettings = {'appearance': f'{"dark" if darkdetect.isDark else "light"}', 
+        defaultSettings = {'appearance': f'{"dark" if darkdetect.isDark() else "light"}', 
                            'defaultCalcMode': 'Standard', 'onTop': False,
                            'opacity': 0.9}
 
+        # settings cache: parsed file contents + the file mtime they were read at
+        self._settingsCache = None
+        self._settingsMtime = 0
+        # changed settings not yet written to file
+        self._pendingSettings = {}
+        self._settingsFlushId = None
+
         # load saved settings, if present
-        settingsData = {}
-        settingsFile = Path('settings.json')
+        settingsFile = Path(SETTINGS_FILE_NAME)
         if settingsFile.is_file():
-            with open('settings.json', 'r') as file:
-                settingsData = json.load(file)
-        else:
-            with open('settings.json', 'w') as file:
-                json.dump(defaultSettings, file, indent = 4)
-            with open('settings.json', 'r') as file:
-                settingsData = json.load(file)
+            self.userSettings = dict(self._getSettings())
+        else: # create w/ defaults; no need to read them back
+            self.userSettings = defaultSettings
+            self._pendingSettings.update(defaultSettings)
+            self._flushSettings()
 
-        # update local settings data
-        self.userSettings = settingsData
+    def _getSettings(self):
+        """ Returns parsed settings file data (empty if no file), only re-reading from disk if the file's mtime has changed. """
 
-    def saveUserSetting(self, key, value):
-        """ Updates a single user setting in external JSON file, as well as locally.  """
+        try:
+            mtime = os.stat(SETTINGS_FILE_NAME).st_mtime_ns
+        except FileNotFoundError:
+            return {}
 
-        # update persistent settings data
-        fileName = 'settings.json'
-        with open(fileName, 'r') as file:
-            settingsData = json.load(file)
-            settingsData[key] = value
+        if self._settingsCache is None or mtime != self._settingsMtime:
+            with open(SETTINGS_FILE_NAME, 'r') as file:
+                self._settingsCache = json.load(file)
+            self._settingsMtime = mtime
 
-        os.remove(fileName)
-        with open(fileName, 'w') as file:
-            json.dump(settingsData, file, indent = 4)
+        return self._settingsCache
+
+    def saveUserSetting(self, key, value):
+        """ Updates a single user setting locally, and schedules a (debounced) write to the external JSON file. """
 
         # update local settings data
         self.userSettings[key] = value
+        self._pendingSettings[key] = value
+
+        # update persistent settings data; coalesce rapid changes (e.g., opacity slider) into one write
+        if self._settingsFlushId is not None:
+            self.after_cancel(self._settingsFlushId)
+        self._settingsFlushId = self.after(SETTINGS_SAVE_DELAY_MS, self._flushSettings)
+
+    def _flushSettings(self):
+        """ Merges pending setting changes into the external JSON file's current data, and atomically writes it. """
+
+        self._settingsFlushId = None
+        # layer file's current data (re-read only if changed on disk) over local data, so edits made outside the app are kept
+        # + required keys are never dropped (e.g., if file was deleted); then apply pending changes
+        settingsData = {**self.userSettings, **self._getSettings(), **self._pendingSettings}
+        self._pendingSettings.clear()
+
+        # write to temp file, then rename over settings file, so it's never seen missing or partially written
+        tempFileName = SETTINGS_FILE_NAME + '.tmp'
+        with open(tempFileName, 'w') as file:
+            json.dump(settingsData, file, indent = 4)
+        os.replace(tempFileName, SETTINGS_FILE_NAME)
+
+        # file now matches settingsData; record so the next flush skips re-parsing our own write
+        self._settingsCache = settingsData
+        self._settingsMtime = os.stat(SETTINGS_FILE_NAME).st_mtime_ns
+
+    def destroy(self):
+        """ Writes any pending settings changes before closing the window. """
+
+        if self._settingsFlushId is not None:
+            self.after_cancel(self._settingsFlushId)
+            self._flushSettings()
+        super().destroy()
 
 
 class ModeOptionMenu(ctk.CTkOptionMenu):
@@ -255,9 +321,9 @@ class ModeOptionMenu(ctk.CTkOptionMenu):
 
     def __init__(self, parent, mode, command):
         
-        super().__init__(master = parent, width = 105, fg_color = (LIGHT_GRAY, DARK_GRAY), button_color = COLORS['orange']['fg'], button_hover_color = COLORS['orange']['hover'],
-                         text_color = (BLACK, WHITE), font = ctk.CTkFont(family = FONT, size = MODE_SWITCH_FONT_SIZE),
-                         values = [e.value for e in CalcMode], command = command)
+        super().__init__(master = parent, width = 105, fg_color = _FG_GRAY, button_color = _ORANGE_FG, button_hover_color = _ORANGE_HOVER,
+                         text_color = _TXT_BW, font = getFont(MODE_SWITCH_FONT_SIZE),
+                         values = _MODE_VALUES, command = command)
         self.grid(column = 0, row = 0, padx = 10)
         self.set(mode) # set drop-down menu's displayed value to be the current calculator mode (defined by user settings or defaults)
 
@@ -265,7 +331,7 @@ class ModeOptionMenu(ctk.CTkOptionMenu):
 class SettingsButton(ctk.CTkButton):
     def __init__(self, parent, command):
         """ """
-        super().__init__(master = parent, fg_color = "transparent", hover_color = LIGHT_GRAY, width = 1, text = "\u2699", text_color = (BLACK, WHITE), command = command)
+        super().__init__(master = parent, fg_color = "transparent", hover_color = LIGHT_GRAY, width = 1, text = "\u2699", text_color = _TXT_BW, command = command)
         self.grid(column = 1, row = 0)
 
 
@@ -6,16 +6,52 @@ calculator.py:
 
 import customtkinter as ctk
 from decimal import Decimal
+from functools import lru_cache
 import math
 from PIL import Image
 from simpleeval import simple_eval
 
 from buttons import *
 
+# decoded PIL images, keyed by file path; each image file is read at most once per process
+_PIL_CACHE = {}
+
+
+@lru_cache(maxsize = 128)
+def evaluateOperation(operation):
+    """ Safely evaluates an operation string; results are memoized, so re-evaluating the same operation skips parsing. """
+
+    return simple_eval(operation)
+
+
+def loadImage(path):
+    """ Returns the decoded PIL image at path, reading it from disk on first use only. """
+
+    image = _PIL_CACHE.get(path)
+    if image is None:
+        image = Image.open(path)
+        image.load() # decode now + release file handle
+        _PIL_CACHE[path] = image
+
+    return image
+
+
+@lru_cache(maxsize = None)
+def getFont(size, slant = 'roman'):
+    """ Returns the shared app CTkFont for the passed size/slant, creating it on first use. """
+
+    return ctk.CTkFont(family = FONT, size = size, slant = slant)
+
 
 class Calculator():
     """ Main / core functionality class. """
 
+    # shared button images, keyed by (dark path, light path)
+    _imageCache = {}
+
+    # flattened per-mode button layout data, built once per mode: {mode: (operatorButtons, numberSpecs, mathSpecs)}
+    _layoutSpecs = {}
+
     def __init__(self, parentApp):
         """ """
 
@@ -28,7 +64,10 @@ class Calculator():
         self.cumulativeInputDisplayString = ctk.StringVar(value = '0')
         self.cumulativeOperationDisplayString = ctk.StringVar(value = '')
         self.cumulativeNumInputList = []
-        self.lastCumulativeNumInputList = []
+        self._cumulativeNumInputStr = '' # joined form of cumulativeNumInputList, maintained incrementally
+        self._exponentCount = 0 # number of '**' operators in cumulative number input
+        self._lastCumulativeNumInputList = []
+        self._lastCumulativeNumInputStr = ''
         self.cumulativeOperationList = []
 
         # data flags
@@ -36,22 +75,43 @@ class Calculator():
         self.lastOperationWasEval = False
         self.skipAddingLastNumInputToOperation = False
 
+        # preload all button images used across CalcModes
+        for layoutData in BUTTON_LAYOUT_DATA.values():
+            for buttonData in (*layoutData['operatorButtons'].values(), *layoutData['mathButtons'].values()):
+                if buttonData['image path']:
+                    self._getImage(buttonData['image path'])
+
+        # CalcMode -> mode-specific widget init function (CM_STANDARD has none)
+        self.modeInitDispatch = {CalcMode.CM_PROGRAMMING: self.initProgrammingWidgets, CalcMode.CM_SCIENTIFIC: self.initScientificWidgets}
+
         # create default (Standard mode) activeFrame + setup its widgets
         self.initCommonStandardWidgets()
         # create any additional widgets if applicable
-        if self.currentMode is not CalcMode.CM_STANDARD:
-            modeInitFunction = self.initProgrammingWidgets if self.currentMode is CalcMode.CM_PROGRAMMING else self.initScientificWidgets
+        modeInitFunction = self.modeInitDispatch.get(self.currentMode)
+        if modeInitFunction is not None:
             modeInitFunction()
 
+        # built activeFrames, kept per CalcMode so switching back to a mode reuses its widgets
+        self.modeFrames = {self.currentMode: self.activeFrame}
+
+    def _setVar(self, stringVar, value):
+        """ Sets the passed StringVar only if its value would change, avoiding redundant display label redraws. """
+
+        valueStr = str(value)
+        if stringVar.get() != valueStr:
+            stringVar.set(valueStr)
+
     def clearAll(self):
         """ Resets output and data to default state. """
 
         # clear display output - set to defaults
-        self.cumulativeInputDisplayString.set('0') 
-        self.cumulativeOperationDisplayString.set('')
+        self._setVar(self.cumulativeInputDisplayString, '0')
+        self._setVar(self.cumulativeOperationDisplayString, '')
 
         # clear data
         self.cumulativeNumInputList.clear()
+        self._cumulativeNumInputStr = ''
+        self._exponentCount = 0
         self.cumulativeOperationList.clear()
 
     def clearLast(self):
@@ -64,19 +124,21 @@ class Calculator():
         if self.lastInputWasNum:
             # remove last num input from data
             if len(self.cumulativeNumInputList) > 0:
-                *self.cumulativeNumInputList,_ = self.cumulativeNumInputList
+                removedInput = self.cumulativeNumInputList.pop()
+                self._cumulativeNumInputStr = self._cumulativeNumInputStr[:len(self._cumulativeNumInputStr) - len(removedInput)]
+                self._exponentCount -= removedInput.count('**')
 
                 # handle case where -(num value) had all numvalues backspaced out, so only '-' left in list
-                if len(self.cumulativeNumInputList) == 1 and self.cumulativeNumInputList[0] == '-':
+                if self._cumulativeNumInputStr == '-':
                     self.cumulativeNumInputList.clear()
-                    self.cumulativeInputDisplayString.set('0')
+                    self._cumulativeNumInputStr = ''
+                    self._setVar(self.cumulativeInputDisplayString, '0')
                 
                 # if still values present, update display output appropriately
-                if len(self.cumulativeNumInputList) > 0:
-                    cumulativeNumInputToDisplay = ''.join(self.cumulativeNumInputList) 
-                    self.cumulativeInputDisplayString.set(cumulativeNumInputToDisplay)
+                if self._cumulativeNumInputStr:
+                    self._setVar(self.cumulativeInputDisplayString, self.getInputDisplayStr())
                 else: # if now empty, set to 0 default display value
-                    self.cumulativeInputDisplayString.set('0')
+                    self._setVar(self.cumulativeInputDisplayString, '0')
 
         # if there's been no input at all, do nothing
         elif len(self.cumulativeOperationList) == 0: 
@@ -85,48 +147,57 @@ class Calculator():
         else: # last input was non-(=) math operator
             
             # remove last operator input from data
-            *self.cumulativeOperationList,_ = self.cumulativeOperationList
+            self.cumulativeOperationList.pop()
 
             # update relevant data
-            self.cumulativeNumInputList = list(self.lastCumulativeNumInputList) # restore previous, prior to clear when math operated pressed
+            # restore previous, prior to clear when math operated pressed (copied, so snapshot survives edits to restored input)
+            self._cumulativeNumInputStr = self._lastCumulativeNumInputStr
+            self.cumulativeNumInputList = list(self._lastCumulativeNumInputList)
+            self._exponentCount = self._cumulativeNumInputStr.count('**')
             self.skipAddingLastNumInputToOperation = True # avoiding duplicates
 
             # update display output
-            self.cumulativeOperationDisplayString.set(' '.join(self.cumulativeOperationList))
+            self._setVar(self.cumulativeOperationDisplayString, ' '.join(self.cumulativeOperationList))
         
     def percentage(self):
         """ Divides current number input / result value by 100. """
 
-        if self.cumulativeNumInputList:
-            # get current number input as float
-            currentNumInputFloat = float(''.join(self.cumulativeNumInputList))
-
-            # convert to percentage
-            currentPercentFloat = currentNumInputFloat / 100
-            self.cumulativeNumInputList[0] = str(currentPercentFloat)
+        currentNumInputStr = self._cumulativeNumInputStr
+        if currentNumInputStr:
+            # convert to percentage + update data
+            # (true division by 100 is correctly rounded; * 0.01 is not, e.g. 35 * 0.01 == 0.35000000000000003)
+            currentPercentStr = str(float(currentNumInputStr) / 100)
+            self.cumulativeNumInputList[:] = [currentPercentStr]
+            self._cumulativeNumInputStr = currentPercentStr
 
             # update display output
-            self.cumulativeInputDisplayString.set(''.join(self.cumulativeNumInputList))
+            self._setVar(self.cumulativeInputDisplayString, currentPercentStr)
 
     def invert(self):
         """ Flips sign of current number input / result. """
 
-        # get current number input as float and as str
-        currentNumInputFloat = float(''.join(self.cumulativeNumInputList))
-        currentNumInputStr = ''.join(self.cumulativeNumInputList)
+        # get current number input as str
+        currentNumInputStr = self._cumulativeNumInputStr
 
         if currentNumInputStr: # if input exists
-            isPositive = True if currentNumInputFloat > 0 else False
-            # flip sign + update data
-            flippedNumInput = list('-' + currentNumInputStr) if isPositive else list(currentNumInputStr[1:])
-            self.cumulativeNumInputList = flippedNumInput
+            isPositive = currentNumInputStr[0] != '-'
+            # flip sign + update data (in place, so later backspaces still remove single inputs)
+            if isPositive:
+                self.cumulativeNumInputList.insert(0, '-')
+                self._cumulativeNumInputStr = '-' + currentNumInputStr
+            else:
+                if self.cumulativeNumInputList[0] == '-':
+                    self.cumulativeNumInputList.pop(0)
+                else: # sign is part of a larger input, e.g. a negative result
+                    self.cumulativeNumInputList[0] = self.cumulativeNumInputList[0][1:]
+                self._cumulativeNumInputStr = currentNumInputStr[1:]
         
             # update display output
             # set base str object to deal with
-            formattedStr = ''.join(self.cumulativeNumInputList)
+            formattedStr = self._cumulativeNumInputStr
             # if positive, and adding a '-' will push us outside maximum window width, shorten first
             if isPositive and len(currentNumInputStr) > 9:
-                formattedStr = self.getResultDisplayStr(float(''.join(flippedNumInput)))
+                formattedStr = self.getResultDisplayStr(float(self._cumulativeNumInputStr))
    
             # check for pre-existing sci notation
             if 'e' in self.cumulativeInputDisplayString.get():
@@ -149,24 +220,25 @@ class Calculator():
                         flippedSciNotation = '-' + sciNotation            
                 else:
                     flippedSciNotation = sciNotation[1:]
-                self.cumulativeInputDisplayString.set(flippedSciNotation)
+                self._setVar(self.cumulativeInputDisplayString, flippedSciNotation)
             
             else:
-                self.cumulativeInputDisplayString.set(formattedStr)
+                self._setVar(self.cumulativeInputDisplayString, formattedStr)
 
     def numberPressed(self, value):
         """ Handles numerical input. """
 
         # each input value added to list as string
-        self.cumulativeNumInputList.append(str(value))
-        # from list, convert to displayed format (w/ new inputs added to end of list (positioned to right of last input)) 
-        cumulativeNumInputToDisplay = ''.join(self.cumulativeNumInputList) 
+        inputStr = str(value)
+        self.cumulativeNumInputList.append(inputStr)
+        # new inputs added to end of cumulative input (positioned to right of last input)
+        self._cumulativeNumInputStr += inputStr
         # format any instances of exponentiation prior to displaying
-        formattedDisplayString = cumulativeNumInputToDisplay.replace('**', '^')
+        formattedDisplayString = self.getInputDisplayStr()
         # if adding another number will push us outside maximum window width, format first
         if len(formattedDisplayString) > 9:
             formattedDisplayString = self.getResultDisplayStr(float(formattedDisplayString))
-        self.cumulativeInputDisplayString.set(formattedDisplayString)
+        self._setVar(self.cumulativeInputDisplayString, formattedDisplayString)
 
         # update tracking data
         self.lastInputWasNum = True
@@ -178,7 +250,7 @@ class Calculator():
         """
 
         # check if last input was also a non-evaluating math operation
-        if not self.lastInputWasNum and not self.lastOperationWasEval and ''.join(self.cumulativeNumInputList): # do not proceed if no num input exists:
+        if not self.lastInputWasNum and not self.lastOperationWasEval and self._cumulativeNumInputStr: # do not proceed if no num input exists:
             if self.cumulativeOperationList[-1] == value:
                 return # can't input same operation twice
             
@@ -190,15 +262,17 @@ class Calculator():
                 # update data
                 self.cumulativeOperationList.append(value)
                 self.cumulativeNumInputList.clear()
+                self._cumulativeNumInputStr = ''
+                self._exponentCount = 0
                 
                 # update display output
-                self.cumulativeInputDisplayString.set('')
-                self.cumulativeOperationDisplayString.set(' '.join(self.cumulativeOperationList))
+                self._setVar(self.cumulativeInputDisplayString, '')
+                self._setVar(self.cumulativeOperationDisplayString, ' '.join(self.cumulativeOperationList))
     
                 return
 
         # get the cumulative number input + append to cumulative operation list
-        currentCumulativeNumInput = ''.join(self.cumulativeNumInputList)
+        currentCumulativeNumInput = self._cumulativeNumInputStr
         if not self.skipAddingLastNumInputToOperation:
             self.cumulativeOperationList.append(currentCumulativeNumInput)
 
@@ -213,13 +287,17 @@ class Calculator():
 
                 # update data
                 self.cumulativeOperationList.append(value)
-                self.lastCumulativeNumInputList = list(self.cumulativeNumInputList) # store in case operation is canceled
-                self.cumulativeNumInputList.clear()
+                # store in case operation is canceled; input list is replaced (not cleared), so no copy needed
+                self._lastCumulativeNumInputList = self.cumulativeNumInputList
+                self._lastCumulativeNumInputStr = self._cumulativeNumInputStr
+                self.cumulativeNumInputList = []
+                self._cumulativeNumInputStr = ''
+                self._exponentCount = 0
                 self.lastOperationWasEval = False
                 
                 # update display output
-                self.cumulativeInputDisplayString.set('')
-                self.cumulativeOperationDisplayString.set(' '.join(self.cumulativeOperationList))
+                self._setVar(self.cumulativeInputDisplayString, '')
+                self._setVar(self.cumulativeOperationDisplayString, ' '.join(self.cumulativeOperationList))
 
             else: # value was '='
                 
@@ -229,24 +307,26 @@ class Calculator():
                 currentCumulativeOperation = self.parseParentheses(currentCumulativeOperation)
                 # evaluate
                 try:
-                    currentResult = simple_eval(currentCumulativeOperation)
+                    currentResult = evaluateOperation(currentCumulativeOperation)
                     #print(currentCumulativeOperation)
                 # error catching
                 except (SyntaxError, KeyError, TypeError):
-                    self.cumulativeInputDisplayString.set('ERROR')
+                    self._setVar(self.cumulativeInputDisplayString, 'ERROR')
                     return
 
                 # update data
                 self.lastOperationWasEval = True
                 self.cumulativeOperationList.clear()
-                self.cumulativeNumInputList = [str(currentResult)] # empty + update by creating new w/ result
+                self._cumulativeNumInputStr = str(currentResult)
+                self._exponentCount = 0
+                self.cumulativeNumInputList = [self._cumulativeNumInputStr] # empty + update by creating new w/ result
                 
                 # update display output: result
                 resultDisplayStr = self.getResultDisplayStr(currentResult)
-                self.cumulativeInputDisplayString.set(resultDisplayStr)
+                self._setVar(self.cumulativeInputDisplayString, resultDisplayStr)
                 # update display output: cumulative operation
                 operationDisplayStr = self.getOperationDisplayStr(currentCumulativeOperation)
-                self.cumulativeOperationDisplayString.set(operationDisplayStr)
+                self._setVar(self.cumulativeOperationDisplayString, operationDisplayStr)
 
     def parseParentheses(self, currentCumulativeOperation):
         """ 
@@ -254,67 +334,54 @@ class Calculator():
         When such instances are found, inserts '*' operator before/after as needed.
         """
 
-        outerIndex = 0 
-        while outerIndex < 2:
-            isLeft = outerIndex # first pass = false, 2nd pass = true
-            parenth = '(' if isLeft else ')'
-            # get indices of all parenth instances
-            parenthPosList = [pos for pos, char in enumerate(currentCumulativeOperation) if char is parenth]
-            parenthCount = len(parenthPosList)
-
-            for innerIndex, parenthPos in enumerate(parenthPosList):
-                if (parenthPos > 0): # ensure there's a left-adjacent value to check
-                    if currentCumulativeOperation[parenthPos - 1].isnumeric(): # left-adjacent numeric?
-                        # ensure there's a right-adjacent value to check
-                        if (parenthPos != len(currentCumulativeOperation) - 1):
-                            if currentCumulativeOperation[parenthPos + 1].isnumeric(): # right-adjacent numeric?
-                                # no adjacent operator found; insert '*' appropriately
-                                posAdjustment = 0 if isLeft else 1
-                                slice = parenthPos + posAdjustment
-                                currentCumulativeOperation = currentCumulativeOperation[:slice] + '*' + currentCumulativeOperation[slice:]
-                                # adjust parenthList indices to account for the insertion
-                                if innerIndex != parenthCount: # if not at end
-                                    for eachIndex in range(0, parenthCount):
-                                            parenthPosList[eachIndex] += 1
-            outerIndex += 1
-
-        return currentCumulativeOperation
+        # single left-to-right pass, building output as a list of chars
+        parsedOperation = []
+        prevChar = ''
+        for char in currentCumulativeOperation:
+            # number directly before '(' or directly after ')': no adjacent operator, so insert '*'
+            if (char == '(' and prevChar.isdigit()) or (prevChar == ')' and char.isdigit()):
+                parsedOperation.append('*')
+            parsedOperation.append(char)
+            prevChar = char
+
+        return ''.join(parsedOperation)
 
     def initCommonStandardWidgets(self):
         """ Initializes common/Standard-CalcMode widgets: OutputLabels + number, operator, and math buttons. """
 
         # setup active frame (container for current CalcMode's contents)
         self.activeFrame = ctk.CTkFrame(self.app, fg_color = 'transparent')
-        self.activeFrame.pack(side = 'bottom', expand = True, fill = 'both', anchor = 's')
+        self.packActiveFrame()
+
+        # get mode-relevant sizing + button layout data
+        mode = self.currentMode.value
+        fontSizes = FONT_SIZES[mode]
+        gridSize = NUM_ROWS_COLUMNS[mode]
+        OPERATOR_BUTTONS, numberSpecs, mathSpecs = self._getLayoutSpecs(mode)
 
         # setup widget fonts
-        self.smallerWidgetFont = ctk.CTkFont(family = FONT, size = FONT_SIZES[self.currentMode.value]['smallerFont'])
-        self.largerWidgetFont = ctk.CTkFont(family = FONT, size = FONT_SIZES[self.currentMode.value]['largerFont'])
+        self.smallerWidgetFont = getFont(fontSizes['smallerFont'])
+        self.largerWidgetFont = getFont(fontSizes['largerFont'])
 
         # setup frame grid layout
-        self.activeFrame.rowconfigure(list(range(NUM_ROWS_COLUMNS[self.currentMode.value]['rows'])), weight = 1, uniform = 'a')
-        self.activeFrame.columnconfigure(list(range(NUM_ROWS_COLUMNS[self.currentMode.value]['columns'])), weight = 1, uniform = 'a')
+        self.activeFrame.rowconfigure(list(range(gridSize['rows'])), weight = 1, uniform = 'a')
+        self.activeFrame.columnconfigure(list(range(gridSize['columns'])), weight = 1, uniform = 'a')
         
         # setup output labels
-        OutputDisplayLabel(self.activeFrame, 0, 'se', self.smallerWidgetFont, self.cumulativeOperationDisplayString, self.currentMode) 
-        OutputDisplayLabel(self.activeFrame, 1, 'e', self.largerWidgetFont, self.cumulativeInputDisplayString, self.currentMode)
-
-        # get mode-relevant button layout data
-        NUMBER_BUTTONS = BUTTON_LAYOUT_DATA[self.currentMode.value]['numberButtons']
-        OPERATOR_BUTTONS = BUTTON_LAYOUT_DATA[self.currentMode.value]['operatorButtons']
-        MATH_BUTTONS = BUTTON_LAYOUT_DATA[self.currentMode.value]['mathButtons']
+        OutputDisplayLabel(self.activeFrame, 0, 'se', self.smallerWidgetFont, self.cumulativeOperationDisplayString, gridSize['columns']) 
+        OutputDisplayLabel(self.activeFrame, 1, 'e', self.largerWidgetFont, self.cumulativeInputDisplayString, gridSize['columns'])
 
         # setup number buttons
-        for number, data in NUMBER_BUTTONS.items():
+        for number, column, span, row, state in numberSpecs:
             NumberButton(
                 parent = self.activeFrame,
                 text = number,
                 function = self.numberPressed,
-                column = data['column'],
-                span = data['span'],
-                row = data['row'],
+                column = column,
+                span = span,
+                row = row,
                 font = self.smallerWidgetFont,
-                state = data['state'])
+                state = state)
 
         # setup clear (AC) button
         Button(parent = self.activeFrame,
@@ -341,10 +408,8 @@ class Calculator():
             font = self.smallerWidgetFont)
         
         # setup invert (+/-) button
-        # create image
-        invertImage = ctk.CTkImage( # 'dark' img contrasts with 'light' bg, & vice versa
-            light_image = Image.open(OPERATOR_BUTTONS['invert']['image path']['dark']),
-            dark_image = Image.open(OPERATOR_BUTTONS['invert']['image path']['light']))
+        # get image
+        invertImage = self._getImage(OPERATOR_BUTTONS['invert']['image path'])
         # create button
         ImageButton(parent = self.activeFrame, 
                     text = OPERATOR_BUTTONS['invert']['text'],
@@ -354,31 +419,34 @@ class Calculator():
                     row = OPERATOR_BUTTONS['invert']['row'])
         
         # setup math buttons
-        for operator, data in MATH_BUTTONS.items():
-            if data['image path']: # if image assigned (CM_STANDARD: division button only)
-                # create image
-                divisionImage = ctk.CTkImage( # 'dark' img contrasts with 'light' bg, & vice versa
-                    light_image = Image.open(data['image path']['dark']),
-                    dark_image = Image.open(data['image path']['light']))
+        for operator, column, row, character, imagePaths in mathSpecs:
+            if imagePaths: # if image assigned (CM_STANDARD: division button only)
+                # get image
+                divisionImage = self._getImage(imagePaths)
                 # create button
                 MathImageButton(
                     parent = self.activeFrame,
                     operator = operator,
                     function = self.mathPressed,
-                    column = data['column'],
-                    row = data['row'],
+                    column = column,
+                    row = row,
                     image = divisionImage)
                 
             else: # no image assigned
                 MathButton(
                     parent = self.activeFrame,
-                    text = data['character'],
+                    text = character,
                     operator = operator,
                     function = self.mathPressed,
-                    column = data['column'],
-                    row = data['row'],
+                    column = column,
+                    row = row,
                     font = self.smallerWidgetFont)
 
+    def packActiveFrame(self):
+        """ Places activeFrame in the app window, filling the space below the menu frame. """
+
+        self.activeFrame.pack(side = 'bottom', expand = True, fill = 'both', anchor = 's')
+
     def initProgrammingWidgets(self):
         """ Initializes Programming CalcMode widgets... """
         
@@ -400,8 +468,8 @@ class Calculator():
         """ Initializes Scientific CalcMode widgets... """
         
         # setup widget fonts
-        self.smallestWidgetFont = ctk.CTkFont(family = FONT, size = 18)
-        self.smallestWidgetFontItalic = ctk.CTkFont(family = FONT, size = 18, slant = 'italic')
+        self.smallestWidgetFont = getFont(18)
+        self.smallestWidgetFontItalic = getFont(18, 'italic')
         
         # setup special number buttons
         for specialNumber, data in SCI_SPECIAL_NUMBER_BUTTONS.items():
@@ -427,23 +495,52 @@ class Calculator():
                     row = data['row'],
                     font = self.smallestWidgetFontItalic if data['font'] == 'italic' else self.smallestWidgetFont)
 
+    def _getLayoutSpecs(self, mode):
+        """ Returns mode's operator button data + number/math button data flattened into tuples, building it on first use. """
+
+        layoutSpecs = self._layoutSpecs.get(mode)
+        if layoutSpecs is None:
+            layoutData = BUTTON_LAYOUT_DATA[mode]
+            numberSpecs = tuple((number, data['column'], data['span'], data['row'], data['state']) for number, data in layoutData['numberButtons'].items())
+            mathSpecs = tuple((operator, data['column'], data['row'], data['character'], data['image path']) for operator, data in layoutData['mathButtons'].items())
+            layoutSpecs = (layoutData['operatorButtons'], numberSpecs, mathSpecs)
+            self._layoutSpecs[mode] = layoutSpecs
+
+        return layoutSpecs
+
+    def _getImage(self, imagePaths):
+        """ Returns the (shared) CTkImage for the passed light/dark image paths, creating it on first use. """
+
+        key = (imagePaths['dark'], imagePaths['light'])
+        image = self._imageCache.get(key)
+        if image is None:
+            image = ctk.CTkImage( # 'dark' img contrasts with 'light' bg, & vice versa
+                light_image = loadImage(imagePaths['dark']),
+                dark_image = loadImage(imagePaths['light']))
+            self._imageCache[key] = image
+
+        return image
+
     def exponentiate(self):
         """ Appends an '**' operator to cumulative input, and updates display output with a formatted ('^') version. """
 
         if self.cumulativeNumInputList: # ensure input exists
             self.cumulativeNumInputList.append('**')
+            self._cumulativeNumInputStr += '**'
+            self._exponentCount += 1
         
             # update display output
-            displayString = ''.join(self.cumulativeNumInputList)
-            formattedDisplayString = displayString.replace('**', '^')
-            self.cumulativeInputDisplayString.set(formattedDisplayString)
+            formattedDisplayString = self.getInputDisplayStr()
+            self._setVar(self.cumulativeInputDisplayString, formattedDisplayString)
 
     def square(self):
         """ Appends an '*' operator + the current cumulative input *to* the current cumulative input, and forces an immediate evaluation. """
 
         if self.cumulativeNumInputList: # ensure input exists
-            cumulativeInputStr = ''.join(self.cumulativeNumInputList)
-            self.cumulativeNumInputList.append('*' + cumulativeInputStr)
+            squareInputStr = '*' + self._cumulativeNumInputStr
+            self.cumulativeNumInputList.append(squareInputStr)
+            self._cumulativeNumInputStr += squareInputStr
+            self._exponentCount = self._cumulativeNumInputStr.count('**')
 
             # evaluate immediately
             self.mathPressed('=')
@@ -454,31 +551,32 @@ class Calculator():
         if self.cumulativeNumInputList: # ensure input exists
             try:
                 # get current number input as float
-                currentNumInputFloat = float(''.join(self.cumulativeNumInputList))
+                currentNumInputFloat = float(self._cumulativeNumInputStr)
                 # evaluate log10 at maximum visible digits
                 logFunc = math.log10 if base == 10 else math.log
                 logResult = self.getResultDisplayStr(logFunc(currentNumInputFloat))
 
             # error catching
             except (SyntaxError, KeyError, ValueError):
-                    self.cumulativeInputDisplayString.set('ERROR')
+                    self._setVar(self.cumulativeInputDisplayString, 'ERROR')
                     return
 
             # update data
-            self.cumulativeNumInputList[0] = str(logResult)
+            self._cumulativeNumInputStr = str(logResult)
+            self.cumulativeNumInputList[:] = [self._cumulativeNumInputStr]
             # update display output
-            self.cumulativeInputDisplayString.set(str(logResult))
+            self._setVar(self.cumulativeInputDisplayString, str(logResult))
             
     def sciNotationFunc(self):
         """ """
         
         if self.cumulativeNumInputList: # ensure have input
             # get current number input as float
-            currentNumInputFloat = float(''.join(self.cumulativeNumInputList))
+            currentNumInputFloat = float(self._cumulativeNumInputStr)
             sciNotationResult = self.convertToSciNotation(currentNumInputFloat)
             
             # update display output
-            self.cumulativeInputDisplayString.set(sciNotationResult)
+            self._setVar(self.cumulativeInputDisplayString, sciNotationResult)
             
     def roundToMaxDigits(self, currentResult):
         """ Formats evaluated result prior to display so as not to exceed window width. """
@@ -493,8 +591,17 @@ class Calculator():
         numDigits = len(str(currentResult))
         maxDigits = 8 if currentResult < 0 else 9
         if numDigits > maxDigits:
-            allowedDigits = maxDigits - len(str(int(currentResult)))
-            currentResult = '{:.{precision}f}'.format(currentResult, precision = allowedDigits)
+            # count integer part's display chars (incl. any '-' sign) arithmetically, rather than via another str() conversion
+            # (log10 digit count is only exact for smaller values, so fall back to str() for large integer parts)
+            intPart = int(currentResult)
+            absIntPart = abs(intPart)
+            if absIntPart < 10**9:
+                numIntDigits = 1 if absIntPart == 0 else int(math.log10(absIntPart)) + 1
+            else:
+                numIntDigits = len(str(absIntPart))
+            intDigits = numIntDigits + (1 if intPart < 0 else 0)
+            allowedDigits = maxDigits - intDigits
+            currentResult = f'{currentResult:.{allowedDigits}f}'
 
         # strip trailing zeroes
         currentResult = str(currentResult).rstrip('0')
@@ -556,6 +663,14 @@ class Calculator():
         
         return str(currentResult)  
     
+    def getInputDisplayStr(self) -> str:
+        """ Returns cumulative number input formatted for display ('**' shown as '^'); skips the replace scan when no '**' is present. """
+
+        if not self._exponentCount:
+            return self._cumulativeNumInputStr
+
+        return self._cumulativeNumInputStr.replace('**', '^')
+
     def getOperationDisplayStr(self, currentOperation) -> str:
         """ """     
         
@@ -567,10 +682,9 @@ class Calculator():
 
 class OutputDisplayLabel(ctk.CTkLabel):
     """ Label representing calculator output: last performed operation, operation result, etc. """
-    def __init__(self, parent, row, anchor, font, stringVar, currentMode):
+    def __init__(self, parent, row, anchor, font, stringVar, colSpan):
         """ """
         super().__init__(master = parent, font = font, textvariable = stringVar)
 
-        # column span depends on CalcMode
-        colSpan = NUM_ROWS_COLUMNS[currentMode.value]['columns']
+        # column span depends on CalcMode; spans full grid width
         self.grid(column = 0, columnspan = colSpan, row = row, sticky = anchor, padx = 15)
\ No newline at end of file
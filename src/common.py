@@ -12,6 +12,10 @@ class CalcMode(Enum):
     CM_PROGRAMMING = "Programming"
     CM_SCIENTIFIC = "Scientific"
 
+# user settings persistence
+SETTINGS_FILE_NAME = 'settings.json'
+SETTINGS_SAVE_DELAY_MS = 250 # debounce window for writing settings changes to disk
+
 # basic layout sizing
 WINDOW_SIZE = (400, 700)
 NUM_ROWS_COLUMNS = {